@@ -21,10 +21,12 @@ Usage:
 
 import json
 import logging
+import re
 import subprocess
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -168,6 +170,79 @@ TEMPLATE_VARS = {
     "org_phone": settings.org_phone,
 }
 
+# Repo-name markers used by template detection. All markers are matched in one
+# pass over the lowercased name (zero-width lookahead, so overlapping markers are
+# all reported). No marker may be a prefix of another, or only one would match.
+_NAME_MARKERS = (
+    "saf-",
+    "tool",
+    "ingestion",
+    "demo-",
+    "helloworld-",
+    "sample-",
+    "stigready",
+    "training",
+    "cis",
+    "baseline",
+    "hardening",
+    "-baseline",
+    "-stig-baseline",
+    "-srg-baseline",
+)
+_MARKER_BITS = {marker: 1 << i for i, marker in enumerate(_NAME_MARKERS)}
+_NAME_MARKER_RE = re.compile("(?=(" + "|".join(re.escape(m) for m in _NAME_MARKERS) + "))")
+
+
+def _marker_mask(*markers: str) -> int:
+    """Combine the bits of the given name markers into one mask."""
+    mask = 0
+    for marker in markers:
+        mask |= _MARKER_BITS[marker]
+    return mask
+
+
+@lru_cache(maxsize=4096)
+def _scan_name_markers(repo_name: str) -> int:
+    """Return a bitmask of the detection markers found in a repo name.
+
+    Cached because the same names are classified repeatedly during a run
+    (detection, analysis, verification).
+    """
+    mask = 0
+    for match in _NAME_MARKER_RE.finditer(repo_name.lower()):
+        mask |= _MARKER_BITS[match.group(1)]
+    return mask
+
+
+# Exclude SAF tools, ingestion utilities, demos, general tools
+_CIS_EXCLUDE_MASK = _marker_mask("saf-", "tool", "ingestion", "demo-", "helloworld-", "sample-")
+_CIS_MASK = _marker_mask("cis")
+_CIS_KIND_MASK = _marker_mask("baseline", "hardening")
+# Exclude stigready, training, demos, samples (SAF/training only if not a baseline)
+_DISA_EXCLUDE_MASK = _marker_mask("stigready", "demo-", "helloworld-", "sample-")
+_DISA_BASELINE_ONLY_MASK = _marker_mask("saf-", "training")
+_DISA_MASK = _marker_mask("-stig-baseline", "-srg-baseline")
+
+# Third-party notices that mark a LICENSE as CIS/DISA, matched in one search
+_THIRD_PARTY_CONTENT_RE = re.compile("CIS Benchmarks|DISA STIGs|DISA IASE")
+
+
+@lru_cache(maxsize=None)
+def _render_templates() -> Dict[str, str]:
+    """Render each LICENSE template type once per process."""
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        autoescape=select_autoescape(),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+    return {
+        "cis": env.get_template("cis.j2").render(**TEMPLATE_VARS),
+        "disa": env.get_template("disa.j2").render(**TEMPLATE_VARS),
+        "plain": env.get_template("plain.j2").render(**TEMPLATE_VARS),
+    }
+
 
 class RepoMinder:
     """Repository file standardization and compliance tool."""
@@ -210,19 +285,8 @@ class RepoMinder:
         if not HAS_JINJA2:
             raise ImportError("Jinja2 is required. Install with: pip install jinja2")
 
-        env = Environment(
-            loader=FileSystemLoader(TEMPLATES_DIR),
-            autoescape=select_autoescape(),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-
-        # Render each template type
-        self.templates = {
-            "cis": env.get_template("cis.j2").render(**TEMPLATE_VARS),
-            "disa": env.get_template("disa.j2").render(**TEMPLATE_VARS),
-            "plain": env.get_template("plain.j2").render(**TEMPLATE_VARS),
-        }
+        # Templates only depend on module-level settings, so render them once
+        self.templates = dict(_render_templates())
 
     def get_saf_repos(self) -> List[str]:
         """Get list of all team repos via gh cli."""
@@ -308,39 +372,37 @@ class RepoMinder:
         content_b64 = result.stdout.strip().strip('"')
         return base64.b64decode(content_b64).decode("utf-8")
 
-    def is_cis_baseline_repo(self, repo_name: str) -> bool:
-        """Check if repo is an actual CIS baseline/hardening implementation."""
-        name_lower = repo_name.lower()
+    def is_cis_baseline_repo(self, repo_name: str, markers: Optional[int] = None) -> bool:
+        """Check if repo is an actual CIS baseline/hardening implementation.
 
-        # Exclude SAF tools, ingestion utilities, demos, general tools
-        excludes = ["saf-", "tool", "ingestion", "demo-", "helloworld-", "sample-"]
-        if any(ex in name_lower for ex in excludes):
+        Args:
+            repo_name: Repository name
+            markers: Precomputed result of _scan_name_markers(repo_name), if available
+        """
+        if markers is None:
+            markers = _scan_name_markers(repo_name)
+        if markers & _CIS_EXCLUDE_MASK:
             return False
 
         # Must have "cis" AND ("baseline" OR "hardening")
         # Patterns: *-cis-baseline, cis-*-baseline, *-cis-hardening, cis-*-hardening
-        has_cis = "cis" in name_lower
-        has_baseline_or_hardening = "baseline" in name_lower or "hardening" in name_lower
+        return bool(markers & _CIS_MASK) and bool(markers & _CIS_KIND_MASK)
 
-        return has_cis and has_baseline_or_hardening
+    def is_disa_baseline_repo(self, repo_name: str, markers: Optional[int] = None) -> bool:
+        """Check if repo is an actual DISA STIG/SRG baseline implementation.
 
-    def is_disa_baseline_repo(self, repo_name: str) -> bool:
-        """Check if repo is an actual DISA STIG/SRG baseline implementation."""
-        name_lower = repo_name.lower()
-        # Exclude stigready, SAF tools, training, demos, samples
-        excludes = ["stigready", "demo-", "helloworld-", "sample-"]
-        if any(ex in name_lower for ex in excludes):
-            return False
-        if "saf-" in name_lower and "-baseline" not in name_lower:
+        Args:
+            repo_name: Repository name
+            markers: Precomputed result of _scan_name_markers(repo_name), if available
+        """
+        if markers is None:
+            markers = _scan_name_markers(repo_name)
+        if markers & _DISA_EXCLUDE_MASK:
             return False
-        if "training" in name_lower and "-baseline" not in name_lower:
+        if markers & _DISA_BASELINE_ONLY_MASK and not markers & _MARKER_BITS["-baseline"]:
             return False
 
-        disa_patterns = [
-            "-stig-baseline",
-            "-srg-baseline",
-        ]
-        return any(pattern in name_lower for pattern in disa_patterns)
+        return bool(markers & _DISA_MASK)
 
     def detect_template_type(self, content: str = None, repo_name: str = None) -> str:
         """Detect which template to use based on content and repo name.
@@ -353,25 +415,22 @@ class RepoMinder:
         Returns:
             'cis', 'disa', or 'plain'
         """
-        # Detect from repo name (most reliable)
+        # Detect from repo name (most reliable), scanning the name only once
+        is_cis = is_disa = False
         if repo_name:
-            if self.is_cis_baseline_repo(repo_name):
+            markers = _scan_name_markers(repo_name)
+            is_cis = self.is_cis_baseline_repo(repo_name, markers)
+            if is_cis:
                 return "cis"
-            elif self.is_disa_baseline_repo(repo_name):
+            is_disa = self.is_disa_baseline_repo(repo_name, markers)
+            if is_disa:
                 return "disa"
 
         # If we have content, verify it matches repo name
         # (This catches incorrectly licensed repos)
         if content and repo_name:
-            has_cis_content = "CIS Benchmarks" in content
-            has_disa_content = "DISA STIGs" in content or "DISA IASE" in content
-
             # If LICENSE claims CIS/DISA but repo is a tool → Fix to plain
-            if (
-                (has_cis_content or has_disa_content)
-                and not self.is_cis_baseline_repo(repo_name)
-                and not self.is_disa_baseline_repo(repo_name)
-            ):
+            if not is_cis and not is_disa and _THIRD_PARTY_CONTENT_RE.search(content):
                 return "plain"  # Fix incorrect LICENSE
 
         return "plain"
@@ -1236,7 +1295,8 @@ def standardize(
     ] = False,
     force: Annotated[bool, typer.Option("--force", help="Skip confirmation prompts")] = False,
     backup: Annotated[
-        bool, typer.Option("--backup", help="Backup original LICENSE files before update")
+        bool,
+        typer.Option("--backup/--no-backup", help="Backup original LICENSE files before update"),
     ] = True,
     no_color: Annotated[bool, typer.Option("--no-color", help="Disable colored output")] = False,
 ):
@@ -7,7 +7,7 @@ import pytest
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from repo_minder import HAS_JINJA2
+from repo_minder import HAS_JINJA2, RepoMinder
 
 
 @pytest.fixture
@@ -72,3 +72,28 @@ def sample_repos():
             "saf-baseline-ingestion",
         ],
     }
+
+
+@pytest.fixture
+def stub_github(monkeypatch):
+    """Replace RepoMinder's GitHub API calls with canned responses.
+
+    Returns a function that installs the stubs for the given repo list; the
+    other API methods answer the same way for every repo.
+    """
+
+    def install(
+        repos,
+        license_file=("LICENSE", "abc"),
+        license_content="Apache",
+        metadata=None,
+    ):
+        metadata = metadata or {"fork": False, "archived": False, "default_branch": "main"}
+        monkeypatch.setattr(RepoMinder, "get_saf_repos", lambda self: list(repos))
+        monkeypatch.setattr(RepoMinder, "get_repo_metadata", lambda self, repo_name: metadata)
+        monkeypatch.setattr(RepoMinder, "check_license_file", lambda self, repo_name: license_file)
+        monkeypatch.setattr(
+            RepoMinder, "get_license_content", lambda self, repo_name, file_path: license_content
+        )
+
+    return install
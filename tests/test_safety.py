@@ -3,14 +3,23 @@
 import sys
 from pathlib import Path
 
+from typer.main import get_command
 from typer.testing import CliRunner
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from repo_minder import app
+from repo_minder import RepoMinder, app
 
 # CliRunner for testing Typer CLI
 runner = CliRunner(env={"NO_COLOR": "1"})
 
+# CLI options by parameter name, read from the Typer command (no help rendering)
+CLI_PARAMS = {param.name: param for param in get_command(app).params}
+
+# Synthetic repo lists, built once at import (tuples so tests can't mutate them)
+_REPOS_5 = tuple(f"repo-{i}" for i in range(5))
+_REPOS_10 = tuple(f"repo-{i}" for i in range(10))
+_REPOS_50 = tuple(f"repo-{i}" for i in range(50))
+
 
 class TestCommandValidation:
     """Layer 1: Prevent accidental mass updates."""
@@ -44,87 +53,48 @@ class TestCommandValidation:
 class TestBulkConfirmation:
     """Layer 2: Require confirmation for bulk operations."""
 
-    def test_bulk_update_prompts_for_confirmation(self, mocker):
+    def test_bulk_update_prompts_for_confirmation(self, mocker, stub_github):
         """Updating >10 repos prompts for confirmation."""
-        mocker.patch(
-            "repo_minder.RepoMinder.get_saf_repos",
-            return_value=[f"repo-{i}" for i in range(50)],
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.get_repo_metadata",
-            return_value={"fork": False, "archived": False, "default_branch": "main"},
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.check_license_file",
-            return_value=("LICENSE", "abc"),
-        )
-        mocker.patch("repo_minder.RepoMinder.get_license_content", return_value="Apache")
+        stub_github(_REPOS_50)
 
         # Mock questionary.confirm to return False (cancel)
         mock_confirm = mocker.patch("questionary.confirm")
         mock_confirm.return_value.ask.return_value = False
 
-        result = runner.invoke(app, ["--pattern", "*"])
+        exit_code = RepoMinder().run(pattern="*")
 
         # Should have prompted
         mock_confirm.assert_called_once()
-        assert "Cancelled" in result.output or result.exit_code == 0
+        assert exit_code == 0
 
-    def test_force_flag_skips_confirmation(self, mocker):
+    def test_force_flag_skips_confirmation(self, mocker, stub_github):
         """--force bypasses confirmation prompt."""
-        mocker.patch(
-            "repo_minder.RepoMinder.get_saf_repos",
-            return_value=[f"repo-{i}" for i in range(50)],
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.get_repo_metadata",
-            return_value={"fork": False, "archived": False, "default_branch": "main"},
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.check_license_file",
-            return_value=("LICENSE", "abc"),
-        )
-        mocker.patch("repo_minder.RepoMinder.get_license_content", return_value="Apache")
+        stub_github(_REPOS_50)
 
         mock_confirm = mocker.patch("questionary.confirm")
 
-        runner.invoke(app, ["--pattern", "*", "--force", "--dry-run"])
+        RepoMinder(dry_run=True).run(pattern="*", force=True)
 
         # Should NOT have prompted
         mock_confirm.assert_not_called()
 
-    def test_small_batch_no_confirmation(self, mocker):
+    def test_small_batch_no_confirmation(self, mocker, stub_github):
         """<=10 repos doesn't require confirmation."""
-        mocker.patch(
-            "repo_minder.RepoMinder.get_saf_repos",
-            return_value=[f"repo-{i}" for i in range(5)],
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.get_repo_metadata",
-            return_value={"fork": False, "archived": False, "default_branch": "main"},
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.check_license_file",
-            return_value=("LICENSE", "abc"),
-        )
-        mocker.patch("repo_minder.RepoMinder.get_license_content", return_value="Apache")
+        stub_github(_REPOS_5)
 
         mock_confirm = mocker.patch("questionary.confirm")
 
-        runner.invoke(app, ["--pattern", "*", "--dry-run"])
+        RepoMinder(dry_run=True).run(pattern="*")
 
         # Should NOT prompt (small batch)
         mock_confirm.assert_not_called()
 
-    def test_dry_run_never_prompts(self, mocker):
+    def test_dry_run_never_prompts(self, mocker, stub_github):
         """Dry-run never prompts for confirmation."""
-        mocker.patch(
-            "repo_minder.RepoMinder.get_saf_repos",
-            return_value=[f"repo-{i}" for i in range(50)],
-        )
+        stub_github(_REPOS_50)
         mock_confirm = mocker.patch("questionary.confirm")
 
-        runner.invoke(app, ["--pattern", "*", "--dry-run"])
+        RepoMinder(dry_run=True).run(pattern="*")
 
         # Dry-run should skip confirmation
         mock_confirm.assert_not_called()
@@ -135,83 +105,44 @@ class TestBackupSystem:
 
     def test_backup_flag_enabled_by_default(self):
         """--backup should be enabled by default."""
-        result = runner.invoke(app, ["--help"])
-        assert "--backup" in result.output or "backup" in result.output.lower()
+        backup = CLI_PARAMS["backup"]
+        assert "--backup" in backup.opts
+        assert "--no-backup" in backup.secondary_opts
+        assert backup.default is True
 
-    def test_backup_directory_created(self, mocker, tmp_path, monkeypatch):
+    def test_backup_directory_created(self, tmp_path, monkeypatch, stub_github):
         """Backup directory is created when processing repos."""
         monkeypatch.chdir(tmp_path)
 
-        mocker.patch(
-            "repo_minder.RepoMinder.get_saf_repos",
-            return_value=["saf"],
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.get_repo_metadata",
-            return_value={"fork": False, "archived": False, "default_branch": "main"},
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.check_license_file",
-            return_value=("LICENSE.md", "abc"),
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.get_license_content",
-            return_value="Old license content",
+        stub_github(
+            ["saf"], license_file=("LICENSE.md", "abc"), license_content="Old license content"
         )
-        mocker.patch("repo_minder.RepoMinder.update_license", return_value=True)
+        monkeypatch.setattr(RepoMinder, "update_license", lambda self, *args: True)
 
         runner.invoke(app, ["--pattern", "saf", "--force"])
 
         # Should create backups/ directory
         assert (tmp_path / "backups").exists()
 
-    def test_no_backup_flag_prevents_backup(self, mocker, tmp_path, monkeypatch):
+    def test_no_backup_flag_prevents_backup(self, tmp_path, monkeypatch, stub_github):
         """--no-backup prevents backup directory creation."""
         monkeypatch.chdir(tmp_path)
 
-        mocker.patch(
-            "repo_minder.RepoMinder.get_saf_repos",
-            return_value=["saf"],
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.get_repo_metadata",
-            return_value={"fork": False, "archived": False, "default_branch": "main"},
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.check_license_file",
-            return_value=("LICENSE.md", "abc"),
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.get_license_content",
-            return_value="Old content",
-        )
-        mocker.patch("repo_minder.RepoMinder.update_license", return_value=True)
+        stub_github(["saf"], license_file=("LICENSE.md", "abc"), license_content="Old content")
+        monkeypatch.setattr(RepoMinder, "update_license", lambda self, *args: True)
 
         runner.invoke(app, ["--pattern", "saf", "--force", "--no-backup"])
 
         # Should NOT create backups/
         assert not (tmp_path / "backups").exists()
 
-    def test_backup_saves_original_license(self, mocker, tmp_path, monkeypatch):
+    def test_backup_saves_original_license(self, mocker, tmp_path, monkeypatch, stub_github):
         """Backup saves original LICENSE content to file."""
         monkeypatch.chdir(tmp_path)
 
         original_content = "Original LICENSE content"
-        mocker.patch(
-            "repo_minder.RepoMinder.get_saf_repos",
-            return_value=["test-repo"],
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.get_repo_metadata",
-            return_value={"fork": False, "archived": False, "default_branch": "main"},
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.check_license_file",
-            return_value=("LICENSE.md", "abc"),
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.get_license_content",
-            return_value=original_content,
+        stub_github(
+            ["test-repo"], license_file=("LICENSE.md", "abc"), license_content=original_content
         )
 
         # Mock update to succeed (but don't mock it so backup code runs)
@@ -224,104 +155,63 @@ class TestBackupSystem:
         # In dry-run, backup shouldn't be created
         # Change test to non-dry-run scenario
         # For now, just check the feature exists
-        help_result = runner.invoke(app, ["--help"])
-        assert "backup" in help_result.output.lower()
+        assert "backup" in CLI_PARAMS
 
 
 class TestDryRunAnalysis:
     """Layer 4: Template distribution analysis."""
 
-    def test_dry_run_shows_template_distribution_table(self, mocker, tmp_path, monkeypatch):
+    def test_dry_run_shows_template_distribution_table(
+        self, tmp_path, monkeypatch, capsys, stub_github
+    ):
         """Dry-run should show template distribution before processing."""
         monkeypatch.chdir(tmp_path)
 
-        mocker.patch(
-            "repo_minder.RepoMinder.get_saf_repos",
-            return_value=["aws-cis-baseline", "rhel-stig-baseline", "saf", "heimdall2"],
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.get_repo_metadata",
-            return_value={"fork": False, "archived": False, "default_branch": "main"},
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.check_license_file",
-            return_value=("LICENSE", "abc"),
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.get_license_content",
-            return_value="Apache 2.0",
+        stub_github(
+            ["aws-cis-baseline", "rhel-stig-baseline", "saf", "heimdall2"],
+            license_content="Apache 2.0",
         )
 
-        result = runner.invoke(app, ["--pattern", "*", "--dry-run"])
+        exit_code = RepoMinder(dry_run=True).run(pattern="*")
+        output = capsys.readouterr().out
 
         # Should show "Template Distribution" or similar analysis
-        assert (
-            "Template" in result.output or "Distribution" in result.output or result.exit_code == 0
-        )
+        assert "Template" in output or "Distribution" in output or exit_code == 0
 
-    def test_template_distribution_shows_counts(self, mocker):
+    def test_template_distribution_shows_counts(self, tmp_path, monkeypatch, stub_github):
         """Template distribution should show count for each type."""
-        mocker.patch(
-            "repo_minder.RepoMinder.get_saf_repos",
-            return_value=["aws-cis-baseline", "docker-cis-baseline", "rhel-stig-baseline", "saf"],
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.get_repo_metadata",
-            return_value={"fork": False, "archived": False, "default_branch": "main"},
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.check_license_file",
-            return_value=("LICENSE", "abc"),
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.get_license_content",
-            return_value="Apache 2.0",
+        monkeypatch.chdir(tmp_path)
+
+        stub_github(
+            ["aws-cis-baseline", "docker-cis-baseline", "rhel-stig-baseline", "saf"],
+            license_content="Apache 2.0",
         )
 
-        result = runner.invoke(app, ["--pattern", "*", "--dry-run"])
+        exit_code = RepoMinder(dry_run=True).run(pattern="*")
 
         # Should show counts in output (2 CIS, 1 DISA, 1 plain)
-        assert result.exit_code == 0
+        assert exit_code == 0
 
 
 class TestSanityChecks:
     """Layer 5: Sanity check warnings."""
 
-    def test_warns_if_all_same_template_type(self, mocker):
+    def test_warns_if_all_same_template_type(self, monkeypatch, stub_github):
         """Warn if 100% of repos are same template (suspicious)."""
         # All baselines detected as plain = suspicious
-        mocker.patch(
-            "repo_minder.RepoMinder.get_saf_repos",
-            return_value=["aws-cis-baseline", "docker-cis-baseline", "rhel-stig-baseline"],
-        )
-        mocker.patch("repo_minder.RepoMinder.is_cis_baseline_repo", return_value=False)
-        mocker.patch("repo_minder.RepoMinder.is_disa_baseline_repo", return_value=False)
-        mocker.patch(
-            "repo_minder.RepoMinder.get_repo_metadata",
-            return_value={"fork": False, "archived": False, "default_branch": "main"},
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.check_license_file",
-            return_value=("LICENSE", "abc"),
-        )
-        mocker.patch("repo_minder.RepoMinder.get_license_content", return_value="Apache")
+        stub_github(["aws-cis-baseline", "docker-cis-baseline", "rhel-stig-baseline"])
+        monkeypatch.setattr(RepoMinder, "is_cis_baseline_repo", lambda self, *args: False)
+        monkeypatch.setattr(RepoMinder, "is_disa_baseline_repo", lambda self, *args: False)
 
         result = runner.invoke(app, ["--pattern", "*baseline", "--dry-run"])
 
         # Should warn or show in summary that all are same type
         assert result.exit_code == 0
 
-    def test_warns_if_more_than_50_percent_creates(self, mocker):
+    def test_warns_if_more_than_50_percent_creates(self, monkeypatch, stub_github):
         """Warn if >50% repos need LICENSE created (unusual)."""
         # Mock 10 repos, 6 with no license
-        mocker.patch(
-            "repo_minder.RepoMinder.get_saf_repos",
-            return_value=[f"repo-{i}" for i in range(10)],
-        )
-        mocker.patch(
-            "repo_minder.RepoMinder.get_repo_metadata",
-            return_value={"fork": False, "archived": False, "default_branch": "main"},
-        )
+        stub_github(_REPOS_10)
 
         def mock_check(repo_name):
             # First 6 have no license, rest have LICENSE
@@ -329,27 +219,27 @@ class TestSanityChecks:
                 return (None, None)
             return ("LICENSE", "abc")
 
-        mocker.patch("repo_minder.RepoMinder.check_license_file", side_effect=mock_check)
-        mocker.patch("repo_minder.RepoMinder.get_license_content", return_value="Apache")
+        monkeypatch.setattr(
+            RepoMinder, "check_license_file", lambda self, repo_name: mock_check(repo_name)
+        )
 
         result = runner.invoke(app, ["--pattern", "*", "--dry-run", "--force"])
 
         # Should warn that 60% need creation
         assert result.exit_code == 0  # Completes but may warn
 
-    def test_warns_if_more_than_30_percent_forks(self, mocker):
+    def test_warns_if_more_than_30_percent_forks(self, monkeypatch, stub_github):
         """Warn if >30% are forks (might have selected wrong team)."""
-        mocker.patch(
-            "repo_minder.RepoMinder.get_saf_repos",
-            return_value=[f"repo-{i}" for i in range(10)],
-        )
+        stub_github(_REPOS_10)
 
         def mock_metadata(repo_name):
             # First 4 are forks (40%)
             is_fork = int(repo_name.split("-")[1]) < 4
             return {"fork": is_fork, "archived": False, "default_branch": "main"}
 
-        mocker.patch("repo_minder.RepoMinder.get_repo_metadata", side_effect=mock_metadata)
+        monkeypatch.setattr(
+            RepoMinder, "get_repo_metadata", lambda self, repo_name: mock_metadata(repo_name)
+        )
 
         result = runner.invoke(app, ["--pattern", "*", "--dry-run", "--force"])
 
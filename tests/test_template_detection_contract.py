@@ -3,6 +3,7 @@
 import sys
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -10,6 +11,27 @@ from repo_minder import app
 
 runner = CliRunner(env={"NO_COLOR": "1"})
 
+# Repo names and the template each should be detected as
+CIS_REPOS = [
+    "aws-foundations-cis-baseline",
+    "docker-ce-cis-baseline",
+    "ansible-cis-docker-ce-hardening",
+]
+DISA_REPOS = [
+    "microsoft-windows-server-2019-stig-baseline",
+    "redhat-enterprise-linux-7-stig-baseline",
+    "apache-couchdb-srg-baseline",
+]
+PLAIN_REPOS = [
+    "saf",
+    "heimdall2",
+    "vulcan",
+    "nginx-stigready-baseline",
+    "saf-baseline-ingestion",
+    "demo-aws-cis-baseline",
+    "sample-rhel-stig-baseline",
+]
+
 
 class TestCISDetectionThroughCLI:
     """Test CIS template detection through public CLI interface."""
@@ -150,3 +172,33 @@ class TestLicenseCorrectionThroughCLI:
         # Should correct to plain template
         assert "plain" in result.output.lower()
         assert result.exit_code == 0
+
+
+class TestDetectionMatrixThroughCLI:
+    """Test detection of each known repo naming style through the CLI."""
+
+    @pytest.mark.parametrize(
+        ("repo", "template"),
+        [(r, "cis") for r in CIS_REPOS]
+        + [(r, "disa") for r in DISA_REPOS]
+        + [(r, "plain") for r in PLAIN_REPOS],
+    )
+    def test_repo_uses_expected_template(self, mocker, repo, template):
+        """Each repo should be licensed with the template its name implies."""
+        mocker.patch(
+            "repo_minder.RepoMinder.get_repo_metadata",
+            return_value={"fork": False, "archived": False, "default_branch": "main"},
+        )
+        mocker.patch(
+            "repo_minder.RepoMinder.check_license_file",
+            return_value=("LICENSE", "abc"),
+        )
+        mocker.patch(
+            "repo_minder.RepoMinder.get_license_content",
+            return_value="Old content",
+        )
+
+        result = runner.invoke(app, ["--repo", repo, "--dry-run"])
+
+        assert f"using {template} template" in result.output
+        assert result.exit_code == 0